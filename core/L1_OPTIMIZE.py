@@ -17,7 +17,7 @@ def fetch_recording_status():
         data = response.json().get("data", [])
         return {item["name"]: {"recording": item["recording"], "streaming": item["streaming"]} for item in data}
     except requests.exceptions.RequestException as e:
-        logging.debug(f"[L1][API] 请求API失败: {e}")
+        logging.debug("[L1][API] 请求API失败: %s", e)
         return {}
 
 def move_folders(folder_path_id, social_folder_names, enable_move):
@@ -36,6 +36,8 @@ def move_folders(folder_path_id, social_folder_names, enable_move):
         logging.debug("[L1][移动] 移动文件夹功能被禁用")
         return None, None, None, None
 
+    social_folder_names = frozenset(social_folder_names)
+
     # 统计信息
     total_folders = {folder_id: 0 for folder_id in folder_path_id.keys()}
     moved_folders = {folder_id: 0 for folder_id in folder_path_id.keys()}
@@ -51,64 +53,86 @@ def move_folders(folder_path_id, social_folder_names, enable_move):
         source_directory = paths["source"]
         target_directory = paths["target"]
 
-        # 确保目标目录存在
-        if not os.path.exists(target_directory):
-            try:
-                os.makedirs(target_directory)
-                logging.debug(f"[L1][目录检查] 创建目标目录: {target_directory}")
-            except Exception as e:
-                logging.debug(f"[L1][目录检查] 创建目录 {target_directory} 失败: {e}")
+        # 确保目标目录存在（exist_ok 将检查与创建合为一步，目录在检查后被并发创建也不会报错）
+        try:
+            os.makedirs(target_directory, exist_ok=True)
+            logging.debug("[L1][目录检查] 目标目录已就绪: %s", target_directory)
+        except Exception as e:
+            logging.debug("[L1][目录检查] 创建目录 %s 失败: %s", target_directory, e)
 
         # 检查源目录是否存在
         if not os.path.exists(source_directory):
-            logging.debug(f"[L1][移动] 源路径 {source_directory} 不存在，跳过处理")
+            logging.debug("[L1][移动] 源路径 %s 不存在，跳过处理", source_directory)
             continue
 
-        logging.debug(f"[L1][移动] 开始处理源路径 {source_directory}")
-
-        # 定义处理用户文件夹的内部函数
-        def process_user_folder(source_folder_path, target_folder_path, folder_name, folder_id):
-            logging.debug(f"[L1][移动] 开始处理用户文件夹 {folder_name}")
-
-            folder_status = recording_status.get(folder_name)
-            if folder_status and (folder_status["recording"] or folder_status["streaming"]):
-                logging.debug(f"[L1][移动] 用户文件夹 {folder_name} 正在直播或者录制中，跳过移动")
-                return
-
-            try:
-                move_folder(source_folder_path, target_folder_path, enable_move)
-                moved_folders[folder_id] += 1
-            except Exception as e:
-                logging.debug(f"[L1][移动] 移动或合并文件夹 {folder_name} 失败: {e}")
-                failed_folders[folder_id] += 1
-                failed_folder_names[folder_id].append(folder_name)
-
-            total_folders[folder_id] += 1  # 更新总计数
+        logging.debug("[L1][移动] 开始处理源路径 %s", source_directory)
 
-        # 遍历源目录
-        for folder_name in os.listdir(source_directory):
-            full_folder_path = os.path.join(source_directory, folder_name)
-            if not os.path.isdir(full_folder_path):
-                continue
+        # 遍历源目录（scandir 的 DirEntry 自带路径与类型信息，无需额外 join/stat）
+        with os.scandir(source_directory) as entries:
+            folder_entries = [entry for entry in entries if entry.is_dir()]
 
-            if folder_name in social_folder_names:
+        # 收集需要处理的用户文件夹 (源路径, 文件夹名)
+        user_folders = []
+        for entry in folder_entries:
+            if entry.name in social_folder_names:
                 # 这是一个社团文件夹，进入其中处理用户文件夹
-                social_folder_path = full_folder_path
-                for user_folder_name in os.listdir(social_folder_path):
-                    user_folder_path = os.path.join(social_folder_path, user_folder_name)
-                    if not os.path.isdir(user_folder_path):
-                        continue
-
-                    source_folder_path = user_folder_path
-                    target_folder_path = os.path.join(target_directory, user_folder_name)
-                    process_user_folder(source_folder_path, target_folder_path, user_folder_name, folder_id)
+                with os.scandir(entry.path) as user_entries:
+                    for user_entry in user_entries:
+                        if user_entry.is_dir():
+                            user_folders.append((user_entry.path, user_entry.name))
             else:
                 # 直接处理用户文件夹
-                source_folder_path = full_folder_path
-                target_folder_path = os.path.join(target_directory, folder_name)
-                process_user_folder(source_folder_path, target_folder_path, folder_name, folder_id)
+                user_folders.append((entry.path, entry.name))
+
+        # 统计先在本地累计，处理完该路径后一次性写回
+        total = moved = failed = 0
+        failed_names = []
+        for source_folder_path, folder_name in user_folders:
+            target_folder_path = os.path.join(target_directory, folder_name)
+            result = process_user_folder(source_folder_path, target_folder_path, folder_name, recording_status)
+            if result is None:
+                continue
+            total += 1
+            if result:
+                moved += 1
+            else:
+                failed += 1
+                failed_names.append(folder_name)
+
+        total_folders[folder_id] = total
+        moved_folders[folder_id] = moved
+        failed_folders[folder_id] = failed
+        failed_folder_names[folder_id] = failed_names
 
         # 删除空文件夹
         delete_empty_folders(source_directory)
 
     return total_folders, moved_folders, failed_folders, failed_folder_names
+
+def process_user_folder(source_folder_path, target_folder_path, folder_name, recording_status):
+    """
+    移动单个用户文件夹，正在直播或录制中的用户会被跳过。
+
+    参数:
+        source_folder_path (str): 源文件夹路径。
+        target_folder_path (str): 目标文件夹路径。
+        folder_name (str): 用户文件夹名称。
+        recording_status (dict): fetch_recording_status 返回的录制状态。
+
+    返回:
+        bool | None: 移动成功返回 True，失败返回 False，跳过返回 None。
+    """
+    logging.debug("[L1][移动] 开始处理用户文件夹 %s", folder_name)
+
+    folder_status = recording_status.get(folder_name)
+    if folder_status and (folder_status["recording"] or folder_status["streaming"]):
+        logging.debug("[L1][移动] 用户文件夹 %s 正在直播或者录制中，跳过移动", folder_name)
+        return None
+
+    try:
+        # 源路径在 move_folders 末尾统一清理空文件夹，这里不再单独清理
+        move_folder(source_folder_path, target_folder_path, cleanup=False)
+        return True
+    except Exception as e:
+        logging.debug("[L1][移动] 移动或合并文件夹 %s 失败: %s", folder_name, e)
+        return False
@@ -2,12 +2,24 @@
 
 import os
 import re
+import sys
+import time
 import logging
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
 from .move import move_folder
 
+# BLREC 文件夹命名规则：日期-时间_标题【blrec-flv|blrec-hls】
+BLREC_PATTERN = r"(\d{8})-(\d{6})_(.+)【(blrec-flv|blrec-hls)】"
+# 正则在模块加载时编译一次，避免每次匹配都查找 re 模块的内部缓存
+BLREC_REGEX = re.compile(BLREC_PATTERN)
+# BLREC 后缀只有两种取值，解析结果统一复用这两个驻留字符串
+BLREC_SUFFIXES = {suffix: sys.intern(suffix) for suffix in ("blrec-flv", "blrec-hls")}
+# 录播姬文件夹名中的时间信息：日期-时间
+RECHEME_TIME_REGEX = re.compile(r"(\d{8}-\d{6})")
 
 class BLREC:
     """
@@ -15,23 +27,56 @@ class BLREC:
     """
 
     def __init__(self):
-        self.pattern = r"(\d{8})-(\d{6})_(.+)【(blrec-flv|blrec-hls)】"
+        self.pattern = BLREC_PATTERN
 
-    def parse_folder_name(self, folder_name):
+    @staticmethod
+    def match_folder_name(folder_name):
+        """
+        用正则匹配 BLREC 文件夹名，先用字符串检查排除明显不符合的名称。
+
+        参数:
+            folder_name (str): 文件夹名称。
+
+        返回:
+            re.Match: 匹配结果，不符合时返回 None。
+        """
+        # 符合规则的名称以 "日期-时间_" 开头并包含 "【blrec-"，大部分名称在这里即可排除，无需运行正则
+        if len(folder_name) < 16 or folder_name[8] != "-" or "【blrec-" not in folder_name:
+            return None
+        return BLREC_REGEX.match(folder_name)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def parse_folder_name(folder_name):
         """
         解析文件夹名，提取日期、标题和后缀。
 
+        合并时每完成一组都会重新扫描目录，同一名称会被反复解析，因此按名称缓存结果。
+
         参数:
             folder_name (str): 文件夹名称。
 
         返回:
             tuple: (date, title, suffix) 或 (None, None, None) 如果无法解析。
         """
-        match = re.match(self.pattern, folder_name)
+        match = BLREC.match_folder_name(folder_name)
         if match:
             date_str, time_str, title, suffix = match.groups()
-            date = datetime.strptime(date_str + "-" + time_str, "%Y%m%d-%H%M%S")
-            return date, title, suffix
+            # 各字段位置固定，直接切片构造 datetime，省去 strptime 每次解析格式串的开销
+            try:
+                date = datetime(
+                    int(date_str[0:4]),
+                    int(date_str[4:6]),
+                    int(date_str[6:8]),
+                    int(time_str[0:2]),
+                    int(time_str[2:4]),
+                    int(time_str[4:6]),
+                )
+            except ValueError:
+                logging.debug("[L2][BLREC] 文件夹名中的日期时间无效：%s", folder_name)
+                return None, None, None
+            # 同一主播的录播标题大量重复，驻留后分组键中的字符串可按身份快速比较
+            return date, sys.intern(title), BLREC_SUFFIXES[suffix]
         return None, None, None
 
     def merge_folders(self, folder_path):
@@ -40,50 +85,71 @@ class BLREC:
 
         参数:
             folder_path (str): 需要处理的文件夹路径。
+
+        返回:
+            bool: 所有文件移动与文件夹删除均成功时返回 True。
         """
-        logging.debug(f"[L2][BLREC] 开始处理路径：{folder_path}")
+        logging.debug("[L2][BLREC] 开始处理路径：%s", folder_path)
 
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
-            logging.warning(f"[L2][BLREC] 路径不存在或不是目录：{folder_path}")
-            return
+        if not os.path.isdir(folder_path):
+            logging.warning("[L2][BLREC] 路径不存在或不是目录：%s", folder_path)
+            return False
+
+        all_succeeded = True
+
+        # 扫描循环中反复用到的函数先绑定为局部变量，省去每次的全局/属性查找
+        join = os.path.join
+        parse = self.parse_folder_name
 
         while True:
             folders = defaultdict(list)
             for root, dirs, files in os.walk(folder_path, topdown=True):
                 for folder_name in dirs:
-                    folder_full_path = os.path.join(root, folder_name)
-                    date, title, suffix = self.parse_folder_name(folder_name)
+                    date, title, suffix = parse(folder_name)
                     if date and title and suffix:
                         folders[(date.date(), title, suffix)].append(
-                            (date, folder_full_path)
+                            (date, join(root, folder_name))
                         )
 
+            # 一次扫描内合并所有可合并的组；已删除的文件夹中的子目录已被移走，
+            # 路径位于其下的组留到下一轮重新扫描后再处理
             merge_completed = False
+            merged_prefixes = []
             for key, folder_list in folders.items():
                 if len(folder_list) > 1:
-                    logging.debug(f"[L2][BLREC] 发现可合并文件夹：{key}")
-                    folder_list.sort(key=lambda x: x[0])
+                    if merged_prefixes and any(
+                        path.startswith(prefix)
+                        for _, path in folder_list
+                        for prefix in merged_prefixes
+                    ):
+                        logging.debug("[L2][BLREC] 路径已变化，留待重新扫描：%s", key)
+                        continue
+                    logging.debug("[L2][BLREC] 发现可合并文件夹：%s", key)
+                    folder_list.sort(key=itemgetter(0))
                     merge_to_folder = folder_list[0][1]
                     for _, folder_to_merge in folder_list[1:]:
                         logging.info(
-                            f"[L2][BLREC] 合并: {folder_to_merge} -> {merge_to_folder}"
+                            "[L2][BLREC] 合并: %s -> %s", folder_to_merge, merge_to_folder
                         )
-                        self.merge_files(merge_to_folder, folder_to_merge)
+                        if not self.merge_files(merge_to_folder, folder_to_merge):
+                            all_succeeded = False
                         try:
                             os.rmdir(folder_to_merge)
                             merge_completed = True
+                            merged_prefixes.append(os.path.join(folder_to_merge, ""))
                         except Exception as e:
+                            all_succeeded = False
                             logging.error(
-                                f"[L2][BLREC] 删除文件夹失败：{folder_to_merge}, 错误：{e}"
+                                "[L2][BLREC] 删除文件夹失败：%s, 错误：%s", folder_to_merge, e
                             )
-                    if merge_completed:
-                        break
                 else:
-                    logging.debug(f"[L2][BLREC] 没有找到可以合并的文件夹组：{key}")
+                    logging.debug("[L2][BLREC] 没有找到可以合并的文件夹组：%s", key)
 
             if not merge_completed:
                 break
 
+        return all_succeeded
+
     def merge_files(self, target_folder, source_folder):
         """
         将 source_folder 中的文件移动到 target_folder。
@@ -91,23 +157,34 @@ class BLREC:
         参数:
             target_folder (str): 目标文件夹路径。
             source_folder (str): 源文件夹路径。
+
+        返回:
+            bool: 所有文件均移动成功时返回 True。
         """
-        if not os.path.exists(source_folder):
-            logging.warning(f"[L2][BLREC] 源文件夹不存在，无法合并: {source_folder}")
-            return
+        try:
+            filenames = os.listdir(source_folder)
+        except FileNotFoundError:
+            logging.warning("[L2][BLREC] 源文件夹不存在，无法合并: %s", source_folder)
+            return False
 
-        for filename in os.listdir(source_folder):
+        all_succeeded = True
+
+        for filename in filenames:
             source_file = os.path.join(source_folder, filename)
             target_file = os.path.join(target_folder, filename)
             try:
-                if os.path.exists(target_file):
-                    os.remove(target_file)
-                os.rename(source_file, target_file)
-                logging.info(f"[L2][BLREC] 文件移动：{source_file} -> {target_file}")
+                # os.replace 会直接覆盖同名目标文件，一次系统调用完成删除+重命名
+                os.replace(source_file, target_file)
+                logging.info("[L2][BLREC] 文件移动：%s -> %s", source_file, target_file)
             except Exception as e:
+                all_succeeded = False
                 logging.error(
-                    f"[L2][BLREC] 文件移动失败：{source_file} -> {target_file}, 错误：{e}"
+                    "[L2][BLREC] 文件移动失败：%s -> %s, 错误：%s",
+                    source_file,
+                    target_file,
+                    e,
                 )
+        return all_succeeded
 
 
 class RECHEME:
@@ -115,33 +192,53 @@ class RECHEME:
     RECHEME 类用于处理其他文件夹的合并操作。
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, L2_OPTIMIZE_RECHEME_SKIP_KEY=()):
+        # 将所有跳过关键字编译成一个正则，每个名称只需扫描一遍
+        if L2_OPTIMIZE_RECHEME_SKIP_KEY:
+            self.skip_pattern = re.compile(
+                "|".join(re.escape(key) for key in L2_OPTIMIZE_RECHEME_SKIP_KEY)
+            )
+        else:
+            self.skip_pattern = None
+
+    def should_skip(self, name):
+        """
+        判断名称中是否包含任一跳过关键字。
+
+        参数:
+            name (str): 文件夹名称或路径。
 
-    def merge_folders(self, folder_path, L2_OPTIMIZE_RECHEME_SKIP_KEY):
+        返回:
+            bool: 包含跳过关键字时返回 True。
+        """
+        return self.skip_pattern is not None and self.skip_pattern.search(name) is not None
+
+    def merge_folders(self, folder_path):
         """
         处理录播姬文件夹的合并操作。
 
         参数:
             folder_path (str): 需要处理的文件夹路径。
-            L2_OPTIMIZE_RECHEME_SKIP_KEY (list): 需要跳过的子字符串列表。
+
+        返回:
+            bool: 所有子文件夹均合并并删除成功时返回 True。
         """
-        logging.debug(f"[L2][录播姬] 开始处理路径：{folder_path}")
+        logging.debug("[L2][录播姬] 开始处理路径：%s", folder_path)
 
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
-            logging.warning(f"[L2][录播姬] 路径不存在或不是目录：{folder_path}")
-            return
+        if not os.path.isdir(folder_path):
+            logging.warning("[L2][录播姬] 路径不存在或不是目录：%s", folder_path)
+            return False
+
+        all_succeeded = True
 
         for root, dirs, files in os.walk(folder_path, topdown=False):
             subfolder_info = defaultdict(list)
             for subfolder in dirs:
-                if any(
-                    substring in subfolder for substring in L2_OPTIMIZE_RECHEME_SKIP_KEY
-                ):
-                    logging.debug(f"[L2][录播姬] 跳过文件夹：{subfolder}")
+                if self.should_skip(subfolder):
+                    logging.debug("[L2][录播姬] 跳过文件夹：%s", subfolder)
                     continue
                 subfolder_path = os.path.join(root, subfolder)
-                match = re.search(r"(\d{8}-\d{6})", subfolder)
+                match = RECHEME_TIME_REGEX.search(subfolder)
                 if match:
                     time_info = match.group()
                     subfolder_info[time_info].append(subfolder_path)
@@ -149,10 +246,11 @@ class RECHEME:
             for time_info, subfolder_list in subfolder_info.items():
                 if len(subfolder_list) > 1:
                     main_folder = self.select_main_folder(subfolder_list)
-                    logging.info(f"[L2][录播姬] 合并文件夹：{main_folder}")
-                    self.merge_subfolders(
-                        main_folder, subfolder_list, L2_OPTIMIZE_RECHEME_SKIP_KEY
-                    )
+                    logging.info("[L2][录播姬] 合并文件夹：%s", main_folder)
+                    if not self.merge_subfolders(main_folder, subfolder_list):
+                        all_succeeded = False
+
+        return all_succeeded
 
     def select_main_folder(self, subfolder_list):
         """
@@ -167,31 +265,39 @@ class RECHEME:
         subfolder_list.sort()
         return subfolder_list[0]
 
-    def merge_subfolders(
-        self, main_folder, subfolders_to_merge, L2_OPTIMIZE_RECHEME_SKIP_KEY
-    ):
+    def merge_subfolders(self, main_folder, subfolders_to_merge):
         """
         合并子文件夹到主文件夹。
 
         参数:
             main_folder (str): 主文件夹路径。
             subfolders_to_merge (list): 需要合并的子文件夹列表。
-            L2_OPTIMIZE_RECHEME_SKIP_KEY (list): 需要跳过的子字符串列表。
+
+        返回:
+            bool: 所有需要合并的子文件夹均已清空并删除时返回 True。
         """
+        all_succeeded = True
         for folder in subfolders_to_merge:
             if folder == main_folder:
                 continue
-            if any(substring in folder for substring in L2_OPTIMIZE_RECHEME_SKIP_KEY):
-                logging.debug(f"[L2][录播姬] 跳过文件夹：{folder}")
+            if self.should_skip(folder):
+                logging.debug("[L2][录播姬] 跳过文件夹：%s", folder)
                 continue
 
-            for item in os.listdir(folder):
-                source_item_path = os.path.join(folder, item)
-                target_item_path = os.path.join(main_folder, item)
-                move_folder(source_item_path, target_item_path)
+            # 先取出目录项再移动，避免在迭代过程中修改正在遍历的目录
+            with os.scandir(folder) as entries:
+                items = [(entry.path, entry.name) for entry in entries]
+            for source_item_path, item in items:
+                move_folder(source_item_path, os.path.join(main_folder, item))
+
+            try:
+                os.rmdir(folder)
+                logging.debug("[L2][录播姬] 删除空文件夹：%s", folder)
+            except OSError as e:
+                all_succeeded = False
+                logging.debug("[L2][录播姬] 文件夹未清空，未删除：%s, 错误：%s", folder, e)
 
-            os.rmdir(folder)
-            logging.debug(f"[L2][录播姬] 删除空文件夹：{folder}")
+        return all_succeeded
 
 
 class L2_Main:
@@ -205,58 +311,113 @@ class L2_Main:
         L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS,
         L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS,
         L2_OPTIMIZE_RECHEME_SKIP_KEY,
+        L2_OPTIMIZE_CACHE_TTL=6 * 3600,
     ):
         self.L2_OPTIMIZE_GLOBAL_PATH = L2_OPTIMIZE_GLOBAL_PATH
-        self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS = L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS
-        self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS = L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS
+        self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS = frozenset(L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS)
+        self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS = frozenset(L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS)
         self.L2_OPTIMIZE_RECHEME_SKIP_KEY = L2_OPTIMIZE_RECHEME_SKIP_KEY
+        self.L2_OPTIMIZE_CACHE_TTL = L2_OPTIMIZE_CACHE_TTL
 
         self.blrec = BLREC()
-        self.recheme = RECHEME()
+        self.recheme = RECHEME(L2_OPTIMIZE_RECHEME_SKIP_KEY)
+
+        # 用户文件夹路径 -> (上次成功处理后的目录修改时间（纳秒）, 记录时间)，跨定时任务复用
+        self.folder_mtime_cache = {}
+        # 本轮处理中出现过的用户文件夹，用于清理缓存中已被 L9 移走的条目
+        self.visited_folders = set()
 
     def process(self):
         """
         执行 L2 优化的主流程，仅处理源路径中的合并操作。
         """
+        self.visited_folders = set()
+
         for id, paths in self.L2_OPTIMIZE_GLOBAL_PATH.items():
             source_path = paths["source"]
 
             # 确保源目录存在
             if not os.path.exists(source_path):
-                logging.warning(f"[L2] 源路径不存在：{source_path}")
+                logging.warning("[L2] 源路径不存在：%s", source_path)
                 continue
 
             # 遍历源目录
-            for folder_name in os.listdir(source_path):
-                folder_path = os.path.join(source_path, folder_name)
+            with os.scandir(source_path) as entries:
+                folder_entries = [entry for entry in entries if entry.is_dir()]
 
-                if not os.path.isdir(folder_path):
-                    continue
+            for entry in folder_entries:
+                folder_name = entry.name
+                folder_path = entry.path
 
                 if folder_name in self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS:
-                    logging.debug(
-                        f"[L2] 跳过文件夹（在跳过列表中）：{folder_name}"
-                    )
+                    logging.debug("[L2] 跳过文件夹（在跳过列表中）：%s", folder_name)
                     continue
 
                 if folder_name in self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS:
                     # 处理社团文件夹
-                    logging.debug(f"[L2] 处理社团文件夹：{folder_name}")
+                    logging.debug("[L2] 处理社团文件夹：%s", folder_name)
                     self.process_social_folder(folder_path)
                     continue
 
-                # 判断文件夹是否符合 BLREC 的命名规则
-                if self.is_blrec_folder(folder_name):
-                    logging.debug(f"[L2] 处理 BLREC 文件夹：{folder_name}")
-                    self.blrec.merge_folders(folder_path)
-                else:
-                    logging.debug(f"[L2] 处理 RECHEME 文件夹：{folder_name}")
-                    self.recheme.merge_folders(
-                        folder_path, self.L2_OPTIMIZE_RECHEME_SKIP_KEY
-                    )
+                self.process_user_folder(folder_path, folder_name)
+
+        # 只保留本轮仍然存在的文件夹，缓存大小不会随历史上出现过的文件夹数量增长
+        self.folder_mtime_cache = {
+            path: entry
+            for path, entry in self.folder_mtime_cache.items()
+            if path in self.visited_folders
+        }
 
         logging.info("[L2] L2 优化处理完成")
 
+    def process_user_folder(self, folder_path, folder_name):
+        """
+        处理单个用户文件夹，自上次成功处理后目录未发生变化时直接跳过。
+
+        目录的修改时间只会在其直接子项增删时改变，L1 移入新录播即属于这种情况。
+        只有合并完全成功时才写入缓存，且缓存超过 L2_OPTIMIZE_CACHE_TTL 秒后重新处理一次，
+        因文件被占用等原因失败的合并会在后续定时任务中重试。
+
+        参数:
+            folder_path (str): 用户文件夹路径。
+            folder_name (str): 用户文件夹名称。
+        """
+        self.visited_folders.add(folder_path)
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return
+        cached = self.folder_mtime_cache.get(folder_path)
+        if (
+            cached is not None
+            and cached[0] == mtime
+            and time.monotonic() - cached[1] < self.L2_OPTIMIZE_CACHE_TTL
+        ):
+            logging.debug("[L2] 跳过文件夹（自上次处理后未变化）：%s", folder_name)
+            return
+
+        # 判断文件夹是否符合 BLREC 的命名规则
+        if self.is_blrec_folder(folder_name):
+            logging.debug("[L2] 处理 BLREC 文件夹：%s", folder_name)
+            succeeded = self.blrec.merge_folders(folder_path)
+        else:
+            logging.debug("[L2] 处理 RECHEME 文件夹：%s", folder_name)
+            succeeded = self.recheme.merge_folders(folder_path)
+
+        if not succeeded:
+            # 合并未完全成功，不写入缓存，下次定时任务重新处理
+            self.folder_mtime_cache.pop(folder_path, None)
+            return
+
+        # 记录合并后的修改时间，合并本身造成的变化不会触发下次重复处理
+        try:
+            self.folder_mtime_cache[folder_path] = (
+                os.stat(folder_path).st_mtime_ns,
+                time.monotonic(),
+            )
+        except OSError:
+            self.folder_mtime_cache.pop(folder_path, None)
+
     def is_blrec_folder(self, folder_name):
         """
         判断文件夹名称是否符合 BLREC 的命名规则。
@@ -267,8 +428,7 @@ class L2_Main:
         返回:
             bool: 如果符合 BLREC 规则，返回 True，否则返回 False。
         """
-        pattern = r"(\d{8})-(\d{6})_(.+)【(blrec-flv|blrec-hls)】"
-        return re.match(pattern, folder_name) is not None
+        return self.blrec.match_folder_name(folder_name) is not None
 
     def process_social_folder(self, social_folder_path):
         """
@@ -277,20 +437,14 @@ class L2_Main:
         参数:
             social_folder_path (str): 社团文件夹路径。
         """
-        for folder_name in os.listdir(social_folder_path):
-            folder_path = os.path.join(social_folder_path, folder_name)
+        with os.scandir(social_folder_path) as entries:
+            folder_entries = [entry for entry in entries if entry.is_dir()]
 
-            if not os.path.isdir(folder_path):
-                continue
+        for entry in folder_entries:
+            folder_name = entry.name
+            folder_path = entry.path
 
             if folder_name in self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS:
-                logging.debug(f"[L2] 跳过文件夹（在跳过列表中）：{folder_name}")
+                logging.debug("[L2] 跳过文件夹（在跳过列表中）：%s", folder_name)
                 continue
-            if self.is_blrec_folder(folder_name):
-                logging.debug(f"[L2] 处理 BLREC 文件夹：{folder_name}")
-                self.blrec.merge_folders(folder_path)
-            else:
-                logging.debug(f"[L2] 处理 RECHEME 文件夹：{folder_name}")
-                self.recheme.merge_folders(
-                    folder_path, self.L2_OPTIMIZE_RECHEME_SKIP_KEY
-                )
+            self.process_user_folder(folder_path, folder_name)
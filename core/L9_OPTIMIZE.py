@@ -1,5 +1,8 @@
 import os
+import errno
 import logging
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from .move import move_folder
 
 class L9_Main:
@@ -13,11 +16,21 @@ class L9_Main:
         L2_OPTIMIZE_GLOBAL_MOVE,
         L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS,
         L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS,
+        L9_OPTIMIZE_GLOBAL_WORKERS=1,
+        L9_OPTIMIZE_GLOBAL_PARALLEL=False,
     ):
         self.L9_OPTIMIZE_GLOBAL_PATH = L9_OPTIMIZE_GLOBAL_PATH
         self.L2_OPTIMIZE_GLOBAL_MOVE = L2_OPTIMIZE_GLOBAL_MOVE
-        self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS = L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS
-        self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS = L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS
+        # 只做成员判断，转为 frozenset 使查找为 O(1)
+        self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS = frozenset(L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS)
+        self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS = frozenset(L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS)
+        self.L9_OPTIMIZE_GLOBAL_WORKERS = L9_OPTIMIZE_GLOBAL_WORKERS
+        self.L9_OPTIMIZE_GLOBAL_PARALLEL = L9_OPTIMIZE_GLOBAL_PARALLEL
+        # 路径配置在运行期间不变，预先展开为 (id, 源路径, 目标路径) 元组
+        self.path_groups = tuple(
+            (id, paths["source"], paths["target"])
+            for id, paths in L9_OPTIMIZE_GLOBAL_PATH.items()
+        )
 
     def process(self):
         """
@@ -27,103 +40,219 @@ class L9_Main:
             logging.info("[L9][移动] 移动功能被禁用")
             return
 
-        for id, paths in self.L9_OPTIMIZE_GLOBAL_PATH.items():
-            source_path = paths["source"]
-            target_path = paths["target"]
+        if self.L9_OPTIMIZE_GLOBAL_PARALLEL:
+            volume_groups = self.group_paths_by_volume()
+        else:
+            volume_groups = [self.path_groups]
 
-            if not os.path.exists(target_path):
-                os.makedirs(target_path)
-                logging.debug(f"[L9][移动] 创建目标目录：{target_path}")
+        if len(volume_groups) > 1:
+            # 源与目标均不共享磁盘的路径组可以同时进行 I/O；共享磁盘或目标路径的路径组仍依次处理，避免争抢磁盘与同名目标
+            with ThreadPoolExecutor(max_workers=len(volume_groups)) as executor:
+                list(executor.map(self.process_path_groups, volume_groups))
+        else:
+            for groups in volume_groups:
+                self.process_path_groups(groups)
 
-            for folder_name in os.listdir(source_path):
-                folder_path = os.path.join(source_path, folder_name)
+        logging.info("[L9][移动] 移动操作完成")
 
-                if not os.path.isdir(folder_path):
-                    continue
+    def group_paths_by_volume(self):
+        """
+        按磁盘对路径组分组：源路径或目标路径位于同一磁盘（st_dev），或目标路径相同的路径组归入同一组依次处理。
 
-                if folder_name in self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS:
-                    logging.debug(f"[L9][移动] 跳过文件夹（在跳过列表中）：{folder_name}")
-                    continue
+        返回:
+            list: 每个元素为需要依次处理的路径组元组列表。
+        """
+        # 并查集：共享任一磁盘或目标路径的路径组合并到同一组
+        parents = list(range(len(self.path_groups)))
 
-                if folder_name in self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS:
-                    # 处理社团文件夹
-                    logging.debug(f"[L9][移动] 处理社团文件夹：{folder_name}")
-                    self.process_social_folder(folder_path, target_path)
-                    continue
+        def find(index):
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
 
-                # 处理普通用户文件夹
-                self.process_user_folder(folder_path, target_path)
+        owners = {}
+        for index, (_, source_path, target_path) in enumerate(self.path_groups):
+            keys = (
+                ("path", os.path.normcase(os.path.realpath(target_path))),
+                self.volume_key(source_path),
+                self.volume_key(target_path),
+            )
+            for key in keys:
+                owner = owners.setdefault(key, index)
+                parents[find(index)] = find(owner)
 
-        logging.info("[L9][移动] 移动操作完成")
+        volumes = {}
+        for index, group in enumerate(self.path_groups):
+            volumes.setdefault(find(index), []).append(group)
+        return list(volumes.values())
 
-    def process_user_folder(self, user_folder_path, target_path):
+    @staticmethod
+    def volume_key(path):
+        """
+        获取路径所在磁盘的标识。路径尚不存在时（如未创建的目标目录）使用最近的已存在上级目录。
+
+        参数:
+            path (str): 文件夹路径。
+
+        返回:
+            tuple: ("dev", 设备号)；无法获取时为 ("path", 路径)，由 process_path_group 报告实际错误。
+        """
+        current = os.path.abspath(path)
+        while True:
+            try:
+                return ("dev", os.stat(current).st_dev)
+            except OSError:
+                parent = os.path.dirname(current)
+                if parent == current:
+                    return ("path", os.path.normcase(os.path.abspath(path)))
+                current = parent
+
+    def process_path_groups(self, groups):
+        """
+        依次处理一组路径组。
+
+        参数:
+            groups (list): (id, 源路径, 目标路径) 元组列表。
+        """
+        for group in groups:
+            self.process_path_group(*group)
+
+    def process_path_group(self, id, source_path, target_path):
+        """
+        处理单个路径组，将源路径中处理完成的文件夹移动到目标路径。
+        参数:
+            id (str): 路径组标识。
+            source_path (str): 源路径。
+            target_path (str): 目标路径。
+        """
+        os.makedirs(target_path, exist_ok=True)
+        logging.debug("[L9][移动] 目标目录已就绪：%s", target_path)
+        target_abs = os.path.abspath(target_path)
+
+        with os.scandir(source_path) as entries:
+            folder_entries = [entry for entry in entries if entry.is_dir()]
+
+        tasks = []
+        for entry in folder_entries:
+            folder_name = entry.name
+            folder_path = entry.path
+
+            if folder_name in self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS:
+                logging.debug("[L9][移动] 跳过文件夹（在跳过列表中）：%s", folder_name)
+                continue
+
+            if folder_name in self.L2_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS:
+                # 处理社团文件夹
+                logging.debug("[L9][移动] 处理社团文件夹：%s", folder_name)
+                self.process_social_folder(folder_path, target_path, folder_name)
+                continue
+
+            # 普通用户文件夹与社团内的用户文件夹一样交给线程池并行移动
+            tasks.append((folder_path, target_path, folder_name, target_abs))
+
+        self.run_user_folder_tasks(tasks)
+
+    def process_user_folder(self, user_folder_path, target_path, user_folder_name, target_abs=None):
         """
         处理用户文件夹的移动操作，根据子文件夹的数量决定是否移动。
         参数:
             user_folder_path (str): 用户文件夹路径。
             target_path (str): 目标路径。
+            user_folder_name (str): 用户文件夹名称。
+            target_abs (str): 目标路径的绝对路径，由调用方预先计算；未提供时在此计算。
         """
-        subfolders = [f for f in os.listdir(user_folder_path) if os.path.isdir(os.path.join(user_folder_path, f))]
-        
-        target_folder_path = os.path.join(target_path, os.path.basename(user_folder_path))
+        target_folder_path = os.path.join(target_path, user_folder_name)
+
+        # 绝对路径只计算一次，供下面两项检查复用；目标路径直接在已规范化的父目录上拼接
+        if target_abs is None:
+            target_abs = os.path.abspath(target_path)
+        user_folder_abs = os.path.abspath(user_folder_path)
+        # 配置中的目标路径通常已是规范的绝对路径，此时直接复用上面拼接好的结果
+        if target_abs == target_path:
+            target_folder_abs = target_folder_path
+        else:
+            target_folder_abs = os.path.join(target_abs, user_folder_name)
 
-        # 检查目标路径是否与源路径相同
-        if os.path.abspath(user_folder_path) == os.path.abspath(target_folder_path):
-            logging.debug(f"[L9][移动] 跳过移动（目标路径与源路径相同）：{user_folder_path}")
+        # 检查目标路径是否与源路径相同：目标存在时按设备号与 inode 比较（可识别符号链接/目录联接），
+        # 目标尚不存在时 samefile 抛出 OSError，退回绝对路径比较
+        try:
+            same_path = os.path.samefile(user_folder_path, target_folder_path)
+        except OSError:
+            same_path = user_folder_abs == target_folder_abs
+        if same_path:
+            logging.debug("[L9][移动] 跳过移动（目标路径与源路径相同）：%s", user_folder_path)
             return
 
-        # 检查目标路径是否在源路径下
-        if os.path.abspath(target_folder_path).startswith(os.path.abspath(user_folder_path)):
-            logging.debug(f"[L9][移动] 跳过移动（目标路径在源路径下）：{user_folder_path} -> {target_folder_path}")
+        # 检查目标路径是否在源路径下（按路径分隔符边界比较，避免 /a/b 误判为 /a/bc 的上级）
+        if target_folder_abs.startswith(os.path.join(user_folder_abs, "")):
+            logging.debug("[L9][移动] 跳过移动（目标路径在源路径下）：%s -> %s", user_folder_path, target_folder_path)
             return
 
-        if len(subfolders) == 1:
+        with os.scandir(user_folder_path) as entries:
+            # 只需区分子文件夹数量是否恰好为 1，数到第 2 个即可停止列举
+            subfolder_count = sum(1 for _ in islice((entry for entry in entries if entry.is_dir()), 2))
+
+        if subfolder_count == 1:
             move_folder(user_folder_path, target_folder_path)
-            logging.debug(f"[L9][移动] 移动文件夹：{user_folder_path} -> {target_folder_path}")
+            logging.debug("[L9][移动] 移动文件夹：%s -> %s", user_folder_path, target_folder_path)
         else:
-            logging.debug(f"[L9][移动] 跳过用户文件夹（子文件夹数量超过 1）：{user_folder_path}")
+            logging.debug("[L9][移动] 跳过用户文件夹（子文件夹数量超过 1）：%s", user_folder_path)
 
-    def process_social_folder(self, social_folder_path, target_path):
+    def process_social_folder(self, social_folder_path, target_path, social_folder_name=None):
         """
         处理社团文件夹，社团文件夹下是用户文件夹，检查用户文件夹的子文件夹数量。
         参数:
             social_folder_path (str): 社团文件夹路径。
             target_path (str): 目标路径。
+            social_folder_name (str): 社团文件夹名称，由调用方从目录项中取得；未提供时从路径中解析。
         """
-        social_folder_name = os.path.basename(social_folder_path)
+        if social_folder_name is None:
+            social_folder_name = os.path.basename(social_folder_path)
         target_social_folder_path = os.path.join(target_path, social_folder_name)
 
-        if not os.path.exists(target_social_folder_path):
-            os.makedirs(target_social_folder_path)
-            logging.debug(f"[L9][移动] 创建目标社团目录：{target_social_folder_path}")
+        os.makedirs(target_social_folder_path, exist_ok=True)
+        logging.debug("[L9][移动] 目标社团目录已就绪：%s", target_social_folder_path)
+        target_social_abs = os.path.abspath(target_social_folder_path)
 
-        for user_folder_name in os.listdir(social_folder_path):
-            user_folder_path = os.path.join(social_folder_path, user_folder_name)
+        with os.scandir(social_folder_path) as entries:
+            user_folder_entries = [entry for entry in entries if entry.is_dir()]
 
-            if not os.path.isdir(user_folder_path):
-                continue
+        tasks = []
+        for entry in user_folder_entries:
+            user_folder_name = entry.name
+            user_folder_path = entry.path
 
             if user_folder_name in self.L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS:
-                logging.debug(f"[L9][移动] 跳过用户文件夹（在跳过列表中）：{user_folder_name}")
-                continue
-
-            # 检查目标路径是否与源路径相同
-            target_user_folder_path = os.path.join(target_social_folder_path, user_folder_name)
-            if os.path.abspath(user_folder_path) == os.path.abspath(target_user_folder_path):
-                logging.debug(f"[L9][移动] 跳过移动（目标路径与源路径相同）：{user_folder_path}")
+                logging.debug("[L9][移动] 跳过用户文件夹（在跳过列表中）：%s", user_folder_name)
                 continue
 
-            # 检查目标路径是否在源路径下
-            if os.path.abspath(target_user_folder_path).startswith(os.path.abspath(user_folder_path)):
-                logging.debug(f"[L9][移动] 跳过移动（目标路径在源路径下）：{user_folder_path} -> {target_user_folder_path}")
-                continue
+            # 处理社团文件夹中的用户文件夹（路径检查由 process_user_folder 统一完成）
+            tasks.append((user_folder_path, target_social_folder_path, user_folder_name, target_social_abs))
 
-            # 处理社团文件夹中的用户文件夹
-            self.process_user_folder(user_folder_path, target_social_folder_path)
+        self.run_user_folder_tasks(tasks)
 
-        # 移动社团文件夹（如果为空）
-        if not os.listdir(social_folder_path):
+        # 删除社团文件夹（如果为空），非空或已不存在时 rmdir 自行失败，无需预先检查
+        try:
             os.rmdir(social_folder_path)
-            logging.debug(f"[L9][移动] 删除空的社团文件夹：{social_folder_path}")
+            logging.debug("[L9][移动] 删除空的社团文件夹：%s", social_folder_path)
+        except OSError as e:
+            if e.errno not in (errno.ENOENT, errno.ENOTEMPTY, errno.EEXIST):
+                logging.warning("[L9][移动] 删除社团文件夹失败：%s, 错误：%s", social_folder_path, e)
 
+    def run_user_folder_tasks(self, tasks):
+        """
+        执行一组用户文件夹移动任务，线程数大于 1 时并行执行。
+        各用户文件夹的源路径与目标路径互不相同，可以安全地并行移动。
+        参数:
+            tasks (list): (user_folder_path, target_path, user_folder_name, target_abs) 元组列表。
+        """
+        workers = min(self.L9_OPTIMIZE_GLOBAL_WORKERS, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                self.process_user_folder(*task)
+            return
 
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 消费结果以便抛出任务中的异常
+            list(executor.map(lambda task: self.process_user_folder(*task), tasks))
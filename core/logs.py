@@ -1,13 +1,20 @@
 # core/logs.py
 
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+# 后台写日志的监听线程，由 log() 创建
+log_listener = None
 
 def log():
     """
     初始化日志记录器，仅配置文件处理器，记录 DEBUG 及以上级别的日志。
     """
+    global log_listener
+
     logger = logging.getLogger()
     if logger.hasHandlers():
         return logger
@@ -43,7 +50,14 @@ def log():
     )
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+    # 业务线程中 QueueHandler 只合并消息参数后将记录放入队列，
+    # 由监听线程套用文件格式并完成轮转与写入；程序退出时停止监听线程并写出队列中剩余的记录
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
     return logger
 
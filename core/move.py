@@ -1,17 +1,106 @@
 import os
+import errno
 import shutil
+import filecmp
 import logging
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
-# MD5计算
-def calculate_md5(file_path):
-    hash_md5 = hashlib.md5()
+# 计算哈希时每次读取的块大小（1 MiB）
+HASH_CHUNK_SIZE = 1 << 20
+# 不超过该大小的文件直接逐字节比较，不计算摘要（64 KiB）
+SMALL_FILE_SIZE = 64 << 10
+# 大文件先比较首尾各一段的长度（64 KiB），不同则无需计算完整摘要
+EDGE_SIZE = 64 << 10
+# 并行比较同名文件的最大线程数（hashlib 计算摘要时会释放 GIL）
+COMPARE_WORKERS = min(8, os.cpu_count() or 1)
+# 所有 move_folder 调用共用同一个线程池，L9 并行移动多个文件夹时总的比较线程数也不超过 COMPARE_WORKERS
+compare_executor = ThreadPoolExecutor(max_workers=COMPARE_WORKERS)
+
+# 文件摘要计算（BLAKE2b，64 位平台上比 MD5 更快，仅用于判断文件是否相同）
+def calculate_digest(file_path):
+    hasher = hashlib.blake2b(digest_size=16)
+    # 复用同一块缓冲区读取，避免每个分块都分配新的 bytes 对象
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+def read_edges(file_path, size):
+    """
+    读取文件开头与结尾各 EDGE_SIZE 字节。
+
+    参数:
+        file_path (str): 文件路径。
+        size (int): 文件大小，需大于 EDGE_SIZE。
+
+    返回:
+        tuple: (开头数据, 结尾数据)。
+    """
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        head = f.read(EDGE_SIZE)
+        f.seek(max(size - EDGE_SIZE, EDGE_SIZE))
+        tail = f.read(EDGE_SIZE)
+    return head, tail
+
+def files_are_identical(source_file, target_file, source_size=None, target_size=None):
+    """
+    判断两个文件内容是否相同。文件大小不同时直接判定为不同，不再计算摘要；
+    小文件直接逐字节比较，两个文件各读取一遍即可得出结果；
+    大文件先比较首尾两段，录制中断或截断的文件通常在这里就能区分，只有首尾都相同时才计算完整摘要。
+    两个路径是不同目录中同一文件的硬链接时直接判定为相同。
+
+    参数:
+        source_file (str): 源文件路径。
+        target_file (str): 目标文件路径。
+        source_size (int): 调用方已知的源文件大小（仅在可免费获得时传入，如 Windows 下的 DirEntry.stat），用于免去 stat 即排除大小不同的文件。
+        target_size (int): 调用方已知的目标文件大小。
+
+    返回:
+        bool: 内容相同时返回 True。
+    """
+    # 大小不同的文件一定不同，已知大小时无需再 stat
+    if source_size is not None and target_size is not None and source_size != target_size:
+        return False
+
+    # Windows 下 DirEntry.stat 不提供 inode 与链接数，硬链接判断必须使用 os.stat 的结果
+    source_stat = os.stat(source_file)
+    target_stat = os.stat(target_file)
+    # 两个路径指向同一文件时无需读取内容。只有两者是不同目录中的目录项（硬链接）时才可删除源路径；
+    # 所在目录相同（同一目录经绑定挂载或联接点看到的两种写法）时删除源路径会删掉目标本身，
+    # 即使该文件在别处另有硬链接也是如此，此时视为不同以保留文件
+    if os.path.samestat(source_stat, target_stat):
+        return source_stat.st_nlink > 1 and not os.path.samefile(
+            os.path.dirname(source_file), os.path.dirname(target_file)
+        )
+    size = source_stat.st_size
+    if size != target_stat.st_size:
+        return False
+    if size <= SMALL_FILE_SIZE:
+        return filecmp.cmp(source_file, target_file, shallow=False)
+    if read_edges(source_file, size) != read_edges(target_file, size):
+        return False
+    return calculate_digest(source_file) == calculate_digest(target_file)
 
-def move_folder(source, target, enable_move=True):
+def rename_or_move(source, target):
+    """
+    移动文件或文件夹到不存在的目标路径。同一分区内直接重命名，失败（如跨分区）时再交给 shutil.move 复制。
+
+    参数:
+        source (str): 源路径。
+        target (str): 目标路径，调用前需确认不存在。
+    """
+    try:
+        os.rename(source, target)
+    except OSError:
+        shutil.move(source, target)
+
+def move_folder(source, target, enable_move=True, cleanup=True):
     """
     移动文件夹或文件到目标目录，如果目标存在同名文件或文件夹，进行合并。
 
@@ -19,50 +108,113 @@ def move_folder(source, target, enable_move=True):
         source (str): 源文件夹路径。
         target (str): 目标文件夹路径。
         enable_move (bool): 是否启用移动功能。
+        cleanup (bool): 合并后是否清理源文件夹中的空文件夹；调用方会在最后统一清理时可传入 False。
     """
     if enable_move:
         if not os.path.exists(target):
-            logging.info(f"[move] 移动文件：{source} -> {target}")
-            shutil.move(source, target)
+            logging.info("[move] 移动文件：%s -> %s", source, target)
+            rename_or_move(source, target)
         else:
-            logging.info(f"[move] 目标文件夹已存在，合并内容：{source} -> {target}")
-            for item in os.listdir(source):
-                source_item_path = os.path.join(source, item)
-                target_item_path = os.path.join(target, item)
-                if os.path.exists(target_item_path):
-                    if os.path.isfile(source_item_path) and os.path.isfile(target_item_path):
-                        source_md5 = calculate_md5(source_item_path)
-                        target_md5 = calculate_md5(target_item_path)
-                        if source_md5 == target_md5:
-                            logging.debug(f"[move] 文件内容相同，删除源文件：{source_item_path}")
-                            os.remove(source_item_path)
-                            delete_empty_folders(os.path.dirname(source_item_path))
+            logging.info("[move] 目标文件夹已存在，合并内容：%s -> %s", source, target)
+            # Windows 下目标文件夹只列举一次，按 normcase 后的名称建立索引，代替对每个源项单独 stat 目标路径。
+            # 其他平台的 normcase 不做处理，而文件系统仍可能不区分大小写（如 APFS、SMB 挂载），
+            # 索引未命中时 os.rename 会静默覆盖同名文件，因此仍逐项检查目标路径
+            if os.name == "nt":
+                with os.scandir(target) as entries:
+                    target_entries = {os.path.normcase(entry.name): entry for entry in entries}
+            else:
+                target_entries = None
+            with os.scandir(source) as entries:
+                source_entries = list(entries)
+
+            # 目标中已存在的同名文件先收集起来，稍后统一比较内容
+            file_pairs = []
+            for source_entry in source_entries:
+                source_item_path = source_entry.path
+                target_item_path = os.path.join(target, source_entry.name)
+                if target_entries is not None:
+                    target_entry = target_entries.get(os.path.normcase(source_entry.name))
+                    target_exists = target_entry is not None
+                    target_is_file = target_exists and target_entry.is_file()
+                else:
+                    target_exists = os.path.lexists(target_item_path)
+                    target_is_file = target_exists and os.path.isfile(target_item_path)
+                if target_exists:
+                    if target_is_file and source_entry.is_file():
+                        # Windows 下目录项的大小来自目录列举结果、无需额外 stat；其他平台交由比较函数统一 stat
+                        if target_entries is not None:
+                            sizes = (source_entry.stat().st_size, target_entry.stat().st_size)
                         else:
-                            logging.debug(f"[move] 目标位置已存在同名项且文件内容不同，跳过：{target_item_path}")
+                            sizes = (None, None)
+                        file_pairs.append((source_item_path, target_item_path) + sizes)
                     else:
-                        logging.debug(f"[move] 目标位置已存在同名项，跳过：{target_item_path}")
+                        logging.debug("[move] 目标位置已存在同名项，跳过：%s", target_item_path)
                     continue
-                logging.debug(f"[move] 移动项：{source_item_path} -> {target_item_path}")
-                shutil.move(source_item_path, target_item_path)
-            try:
-                delete_empty_folders(source)
-            except OSError:
-                logging.debug(f"[move] 源文件夹未完全清空，未删除：{source}")
+                logging.debug("[move] 移动项：%s -> %s", source_item_path, target_item_path)
+                rename_or_move(source_item_path, target_item_path)
+
+            # 源与目标位于不同磁盘时，各文件对的比较可以并行读取与计算摘要；
+            # 同一磁盘上并行读取多个大文件只会争抢磁盘，依次比较。删除操作始终在当前线程中依次执行
+            if len(file_pairs) > 1 and COMPARE_WORKERS > 1 and os.stat(source).st_dev != os.stat(target).st_dev:
+                results = list(compare_executor.map(lambda pair: files_are_identical(*pair), file_pairs))
+            else:
+                results = [files_are_identical(*pair) for pair in file_pairs]
+
+            for (source_item_path, target_item_path, _, _), identical in zip(file_pairs, results):
+                if identical:
+                    logging.debug("[move] 文件内容相同，删除源文件：%s", source_item_path)
+                    os.remove(source_item_path)
+                else:
+                    logging.debug("[move] 目标位置已存在同名项且文件内容不同，跳过：%s", target_item_path)
+            # 合并结束后统一清理一次空文件夹，避免在遍历中途删除尚未处理的空子目录
+            if cleanup:
+                try:
+                    delete_empty_folders(source)
+                except OSError:
+                    logging.debug("[move] 源文件夹未完全清空，未删除：%s", source)
     else:
-        logging.info(f"[move] 移动文件夹功能已禁用：{source} -> {target}")
+        logging.info("[move] 移动文件夹功能已禁用：%s -> %s", source, target)
 
 def delete_empty_folders(directory):
     """
-    递归删除空文件夹。
+    递归删除空文件夹（含 directory 自身）。
+
+    使用显式栈做后序遍历，子文件夹总是先于父文件夹检查，目录层级再深也不会触发递归深度限制。
+    含有文件或未能删除的子文件夹的目录不会再尝试 rmdir。
 
     参数:
         directory (str): 需要检查并删除的文件夹路径。
     """
-    if os.path.isdir(directory):
-        for folder_name in os.listdir(directory):
-            folder_path = os.path.join(directory, folder_name)
-            if os.path.isdir(folder_path):
-                delete_empty_folders(folder_path)
-        if not os.listdir(directory):
-            os.rmdir(directory)
-            logging.debug(f"[delete] 已删除空文件夹：{directory}")
+    if not os.path.isdir(directory):
+        return
+
+    # 已确定非空、不需要尝试删除的文件夹
+    kept_folders = set()
+    # (路径, 父文件夹路径, 子文件夹是否已入栈)
+    stack = [(directory, None, False)]
+    while stack:
+        folder_path, parent_path, expanded = stack.pop()
+        if not expanded:
+            stack.append((folder_path, parent_path, True))
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        stack.append((entry.path, folder_path, False))
+                    else:
+                        kept_folders.add(folder_path)
+            continue
+
+        if folder_path in kept_folders:
+            if parent_path is not None:
+                kept_folders.add(parent_path)
+            continue
+
+        # 子项均已删除时直接尝试删除，期间被写入新内容的文件夹由 rmdir 返回 ENOTEMPTY
+        try:
+            os.rmdir(folder_path)
+            logging.debug("[delete] 已删除空文件夹：%s", folder_path)
+        except OSError as e:
+            if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                raise
+            if parent_path is not None:
+                kept_folders.add(parent_path)
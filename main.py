@@ -82,6 +82,8 @@ L2_OPTIMIZE_RECHEME_SKIP_KEY = [
     "000_部分丢失",
     "1970",
 ]
+# (L2全局)文件夹修改时间缓存的有效期（秒），超过后即使文件夹未变化也重新合并一次
+L2_OPTIMIZE_CACHE_TTL = 6 * 3600
 
 
 ### L9 ###
@@ -93,18 +95,27 @@ L9_OPTIMIZE_GLOBAL_PATH = {
 
 # (L9全局)是否启用移动文件夹
 L9_OPTIMIZE_GLOBAL_MOVE = True
+# (L9全局)并行移动用户文件夹的线程数，1 为串行；同一磁盘上并行移动（尤其是跨分区复制或合并时比较文件）会争抢磁盘，
+# 仅当磁盘能承受并发读写（如 SSD）时再调大
+L9_OPTIMIZE_GLOBAL_WORKERS = 1
+# (L9全局)是否并行处理互不共享磁盘的路径组，源或目标位于同一磁盘（或目标相同）的路径组始终依次处理
+L9_OPTIMIZE_GLOBAL_PARALLEL = True
 
 
 ### 主要操作 ###
 
 
+# L2 实例在定时任务之间复用，保留其文件夹修改时间缓存
+l2_main = L2_Main(
+    L2_OPTIMIZE_GLOBAL_PATH,
+    L1_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS,
+    L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS,
+    L2_OPTIMIZE_RECHEME_SKIP_KEY,
+    L2_OPTIMIZE_CACHE_TTL,
+)
+
+
 def L2_OPTIMIZE():
-    l2_main = L2_Main(
-        L2_OPTIMIZE_GLOBAL_PATH,
-        L1_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS,
-        L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS,
-        L2_OPTIMIZE_RECHEME_SKIP_KEY,
-    )
     l2_main.process()
 
 
@@ -114,6 +125,8 @@ def L9_OPTIMIZE():
         L9_OPTIMIZE_GLOBAL_MOVE,
         L1_OPTIMIZE_GLOBAL_SOCIAL_FOLDERS,
         L2_OPTIMIZE_GLOBAL_SKIP_FOLDERS,
+        L9_OPTIMIZE_GLOBAL_WORKERS,
+        L9_OPTIMIZE_GLOBAL_PARALLEL,
     )
     l9_main.process()
 
@@ -129,55 +142,53 @@ def get_l2_folder(directory_path):
         list: 子文件夹名称列表。
     """
     try:
-        return [
-            folder
-            for folder in os.listdir(directory_path)
-            if os.path.isdir(os.path.join(directory_path, folder))
-        ]
+        with os.scandir(directory_path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
     except FileNotFoundError:
         log_print(f"[统计] 目录不存在: {directory_path}")
         return []
 
 
 def statistics(L1_paths, total_L1, moved_L1, failed_L1, failed_names_L1, GLOBAL_GOTIFY_IP, GLOBAL_GOTIFY_TOKEN):
-    message = f"\n===== L1 统计 =====\n"
+    # 各行先收集到列表中，最后一次性拼接，避免反复 += 生成中间字符串
+    message_parts = ["\n===== L1 统计 =====\n"]
     log_print("===== L1 统计 =====")
 
     for folder_id in L1_paths.keys():
         log_print(f"--- {folder_id} ---")
-        message += f"--- {folder_id} ---\n"
+        message_parts.append(f"--- {folder_id} ---\n")
 
         source_path = L1_paths[folder_id]["source"]
         target_path = L1_paths[folder_id]["target"]
         processed = total_L1.get(folder_id, 0) - moved_L1.get(folder_id, 0) - failed_L1.get(folder_id, 0)
 
         log_print(f"[统计] 源路径: {source_path}")
-        message += f"[统计] 源路径: {source_path}\n"
+        message_parts.append(f"[统计] 源路径: {source_path}\n")
 
         log_print(f"[统计] 处理前: {total_L1.get(folder_id, 0)}, 处理后: {processed}")
-        message += f"[统计] 处理前: {total_L1.get(folder_id, 0)}, 处理后: {processed}\n"
+        message_parts.append(f"[统计] 处理前: {total_L1.get(folder_id, 0)}, 处理后: {processed}\n")
 
         log_print(f"[统计] 移动成功: {moved_L1.get(folder_id, 0)}, 移动失败: {failed_L1.get(folder_id, 0)}")
-        message += f"[统计] 移动成功: {moved_L1.get(folder_id, 0)}, 移动失败: {failed_L1.get(folder_id, 0)}\n"
+        message_parts.append(f"[统计] 移动成功: {moved_L1.get(folder_id, 0)}, 移动失败: {failed_L1.get(folder_id, 0)}\n")
 
         failed_folders = ", ".join(failed_names_L1.get(folder_id, []))
         log_print(f"[统计] 移动失败文件夹: {failed_folders}")
-        message += f"[统计] 移动失败文件夹: {failed_folders}\n"
+        message_parts.append(f"[统计] 移动失败文件夹: {failed_folders}\n")
 
         log_print(f"[统计] 输出路径: {target_path}")
-        message += f"[统计] 输出路径: {target_path}\n"
+        message_parts.append(f"[统计] 输出路径: {target_path}\n")
 
         try:
-            current_folders = [
-                folder for folder in os.listdir(target_path)
-                if os.path.isdir(os.path.join(target_path, folder))
-            ]
+            with os.scandir(target_path) as entries:
+                current_folders = [entry.name for entry in entries if entry.is_dir()]
             current_folders_str = ", ".join(current_folders)
         except FileNotFoundError:
             current_folders_str = "目标路径不存在"
 
         log_print(f"[统计] 文件夹: {current_folders_str}")
-        message += f"[统计] 文件夹: {current_folders_str}\n"
+        message_parts.append(f"[统计] 文件夹: {current_folders_str}\n")
+
+    message = "".join(message_parts)
 
     # 推送统计信息到 Gotify
     try: